@@ -1,7 +1,13 @@
 from enum import Enum
 
 
-class Region(Enum):
+class _LowerValue(object):
+    # Used to build URLs, so only lowercase the value once per member
+    def __init__(self, value: str) -> None:
+        self.lower_value = value.lower()
+
+
+class Region(_LowerValue, Enum):
     brazil = "BR"
     europe_north_east = "EUNE"
     europe_west = "EUW"
@@ -92,7 +98,7 @@ class Region(Enum):
             return Continent.sea
 
 
-class Platform(Enum):
+class Platform(_LowerValue, Enum):
     brazil = "BR1"
     europe_north_east = "EUN1"
     europe_west = "EUW1"
@@ -166,7 +172,7 @@ DEFAULT_LOCALE = {
 }
 
 
-class Continent(Enum):
+class Continent(_LowerValue, Enum):
     americas = "AMERICAS"
     asia = "ASIA"
     europe = "EUROPE"
@@ -23,9 +23,12 @@ except ImportError:
     certifi = None
 
 try:
-    import ujson as json
+    import orjson as json
 except ImportError:
-    import json
+    try:
+        import ujson as json
+    except ImportError:
+        import json
 
 
 _print_calls = True
@@ -253,7 +256,8 @@ else:  # Use requests
 
             # Load JSON if necessary
             if "APPLICATION/JSON" in content_type:
-                body = r.json()
+                # Use the fastest available parser instead of requests' stdlib json
+                body = json.loads(r.content)
             elif "IMAGE/" in content_type:
                 body = r.content
             else:
@@ -1,6 +1,18 @@
-import copy
-from typing import Type, TypeVar, MutableMapping, Any, Iterable
-from collections import defaultdict
+from typing import (
+    Type,
+    TypeVar,
+    MutableMapping,
+    Mapping,
+    Any,
+    Iterable,
+    Dict,
+    Tuple,
+    Generator,
+)
+from collections import defaultdict, OrderedDict
+from threading import Lock, Event
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 from datapipelines import (
     DataSource,
@@ -22,7 +34,7 @@ from ..dto.staticdata.realm import RealmDto
 from ..dto.staticdata.map import MapDto, MapListDto
 from .common import HTTPClient, HTTPError
 from .riotapi.common import _get_latest_version
-from .uniquekeys import _hash_included_data, convert_region_to_platform
+from .uniquekeys import convert_region_to_platform
 
 try:
     import ujson as json
@@ -31,21 +43,95 @@ except ImportError:
 
 T = TypeVar("T")
 
+_DDRAGON_URL = "https://ddragon.leagueoflegends.com"
+_ALL_INCLUDED_DATA = frozenset({"all"})
+
+
+class _LRUCache(object):
+    # DDragon lists never change for a given version, so entries only need to be
+    # evicted to keep memory bounded in long running processes.
+    def __init__(self, max_size: int) -> None:
+        if max_size < 0:
+            raise ValueError(
+                "DDragon cache_size must be non-negative, got {}.".format(max_size)
+            )
+        self._max_size = max_size
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def __contains__(self, key: Any) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __getitem__(self, key: Any) -> Any:
+        with self._lock:
+            value = self._data[key]
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+
+
+def _freeze_included_data(query: MutableMapping[str, Any]) -> None:
+    # DDragon always serves everything, so a missing includedData means "all" too
+    included_data = query.get("includedData", _ALL_INCLUDED_DATA)
+    # Almost every query uses the default, so share one instance (and its hash)
+    if included_data == _ALL_INCLUDED_DATA:
+        query["includedData"] = _ALL_INCLUDED_DATA
+    elif not isinstance(included_data, frozenset):
+        query["includedData"] = frozenset(included_data)
+
+
+def _dto_fields(query: MutableMapping[str, Any]) -> Dict[str, Any]:
+    fields = {"region": query["platform"].region.value, "version": query["version"]}
+    if "locale" in query:
+        fields["locale"] = query["locale"]
+    if "includedData" in query:
+        fields["includedData"] = query["includedData"]
+    return fields
+
+
+def _for_region(dto: T, region: str) -> T:
+    # Shared lists keep the region of the platform that first fetched them
+    if dto["region"] == region:
+        return dto
+    dto = type(dto)(dto)
+    dto["region"] = region
+    return dto
+
+
+def _index_by(
+    dtos: Iterable[Mapping[str, Any]], *attrnames: str
+) -> Dict[str, Dict[Any, Mapping[str, Any]]]:
+    # The first dto with a given value wins, matching a linear scan over the list.
+    indexes = {attrname: {} for attrname in attrnames}
+    for dto in dtos:
+        for attrname, index in indexes.items():
+            value = dto.get(attrname, None)
+            if value is not None:
+                index.setdefault(value, dto)
+    return indexes
+
 
 class DDragon(DataSource):
-    def __init__(self, http_client: HTTPClient = None) -> None:
+    def __init__(self, http_client: HTTPClient = None, cache_size: int = 40) -> None:
         if http_client is None:
             self._client = HTTPClient()
         else:
             self._client = http_client
 
-        self._cache = {
-            ChampionListDto: {},
-            RuneListDto: {},
-            ItemListDto: {},
-            SummonerSpellListDto: {},
-            MapListDto: {},
-        }
+        # Both are keyed by (list dto type, query hash)
+        self._cache = _LRUCache(cache_size)
+        # id -> dto and name -> dto lookups for the lists above
+        self._index_cache = _LRUCache(cache_size)
+        # Lists currently being fetched, so concurrent misses only fetch once
+        self._inflight = {}
+        self._inflight_lock = Lock()
 
     @DataSource.dispatch
     def get(
@@ -66,11 +152,134 @@ class DDragon(DataSource):
         pass
 
     def calculate_hash(self, query):
-        hash = list(value for _, value in sorted(query.items()))
-        for i, value in enumerate(hash):
-            if isinstance(value, set):
-                hash[i] = _hash_included_data(value)
-        return tuple(hash)
+        return (
+            query["platform"],
+            query.get("version"),
+            query.get("locale"),
+            query.get("includedData"),
+        )
+
+    def _list_hash(self, type: Type[T], query: MutableMapping[str, Any]) -> Tuple:
+        if type is ChampionListDto:
+            # Every champion is stamped with its region, so these can't be shared
+            return self.calculate_hash(query)
+        # DDragon serves the same files to every platform
+        return (query.get("version"), query.get("locale"), query.get("includedData"))
+
+    @contextmanager
+    def _loading(self, type: Type[T], ahash: Tuple) -> Generator[T, None, None]:
+        # Yields the cached list, or None if the caller should fetch (and cache) it.
+        key = type, ahash
+        while True:
+            try:
+                cached = self._cache[key]
+            except KeyError:
+                pass
+            else:
+                yield cached
+                return
+            with self._inflight_lock:
+                event = self._inflight.get(key)
+                if event is None:
+                    if key in self._cache:
+                        # Finished loading between the cache probe and taking the lock
+                        continue
+                    event = self._inflight[key] = Event()
+                    break
+            event.wait()
+        try:
+            yield None
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            event.set()
+
+    def _get_indexes(
+        self,
+        type: Type[T],
+        query: MutableMapping[str, Any],
+        dtos: Iterable[Mapping[str, Any]],
+        attrnames: Iterable[str] = ("id", "name"),
+    ) -> Dict[str, Dict[Any, Mapping[str, Any]]]:
+        ahash = self._list_hash(type, query)
+        try:
+            return self._index_cache[type, ahash]
+        except KeyError:
+            pass
+        # The list may have come from a store further up the pipeline
+        indexes = _index_by(dtos, *attrnames)
+        self._index_cache[type, ahash] = indexes
+        return indexes
+
+    def _get_list_indexes(
+        self,
+        list_type: Type[T],
+        query: MutableMapping[str, Any],
+        context: PipelineContext,
+        exclude: Iterable[str],
+        attrnames: Iterable[str] = ("id", "name"),
+    ) -> Mapping[str, Mapping[Any, Any]]:
+        list_query = {key: value for key, value in query.items() if key not in exclude}
+        if "locale" not in list_query:
+            list_query["locale"] = query["platform"].default_locale
+        data = context[context.Keys.PIPELINE].get(list_type, query=list_query)["data"]
+        if isinstance(data, dict):
+            data = data.values()
+        elif not isinstance(data, list):
+            raise ValueError(
+                "The data from DDragon came back in an unexpected format. Please report this on Github!"
+            )
+        return self._get_indexes(list_type, list_query, data, attrnames)
+
+    def _get_entity(
+        self,
+        dto_type: Type[T],
+        list_type: Type[Any],
+        query: MutableMapping[str, Any],
+        context: PipelineContext,
+    ) -> T:
+        indexes = self._get_list_indexes(list_type, query, context, ("id", "name"))
+        if "id" in query:
+            entity = indexes["id"].get(query["id"])
+        elif "name" in query:
+            entity = indexes["name"].get(query["name"])
+        else:
+            raise RuntimeError("Impossible!")
+        if entity is None:
+            raise NotFoundError
+        return dto_type(entity, **_dto_fields(query))
+
+    def _get_many_entities(
+        self,
+        dto_type: Type[T],
+        list_type: Type[Any],
+        query: MutableMapping[str, Any],
+        context: PipelineContext,
+        description: str,
+    ) -> Generator[T, None, None]:
+        indexes = self._get_list_indexes(list_type, query, context, ("ids", "names"))
+        if "ids" in query:
+            attrname, values = "id", query["ids"]
+        else:
+            attrname, values = "name", query["names"]
+        index = indexes[attrname]
+
+        # Copy each dto rather than writing these into the shared list
+        fields = _dto_fields(query)
+
+        def generator():
+            for value in values:
+                try:
+                    entity = index[value]
+                except KeyError as error:
+                    raise NotFoundError(
+                        'Could not find {description} with {attrname} "{value}"'.format(
+                            description=description, attrname=attrname, value=value
+                        )
+                    ) from error
+                yield dto_type(entity, **fields)
+
+        return generator()
 
     #############
     # Champions #
@@ -90,41 +299,39 @@ class DDragon(DataSource):
     )
 
     @get.register(ChampionDto)
-    @validate_query(_validate_get_champion_query, convert_region_to_platform)
+    @validate_query(
+        _validate_get_champion_query, convert_region_to_platform, _freeze_included_data
+    )
     def get_champion(
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> ChampionDto:
-        champions_query = copy.deepcopy(query)
-        if "id" in champions_query:
-            champions_query.pop("id")
-        if "name" in champions_query:
-            champions_query.pop("name")
-        champions = context[context.Keys.PIPELINE].get(
-            ChampionListDto, query=champions_query
-        )
+        return self._get_entity(ChampionDto, ChampionListDto, query, context)
 
-        def find_matching_attribute(list_of_dtos, attrname, attrvalue):
-            for dto in list_of_dtos:
-                if dto.get(attrname, None) == attrvalue:
-                    return dto
+    _validate_get_many_champion_query = (
+        Query.has("platform")
+        .as_(Platform)
+        .also.has("ids")
+        .as_(Iterable)
+        .or_("names")
+        .as_(Iterable)
+        .also.can_have("version")
+        .with_default(_get_latest_version, supplies_type=str)
+        .also.can_have("locale")
+        .also.can_have("includedData")
+    )
 
-        # The `data` is a list of champion data instances
-        if "id" in query:
-            find = "id", query["id"]
-        elif "name" in query:
-            find = "name", query["name"]
-        else:
-            raise RuntimeError("Impossible!")
-        champion = find_matching_attribute(champions["data"].values(), *find)
-        if champion is None:
-            raise NotFoundError
-        champion["region"] = query["platform"].region.value
-        champion["version"] = query["version"]
-        if "locale" in query:
-            champion["locale"] = query["locale"]
-        if "includedData" in query:
-            champion["includedData"] = query["includedData"]
-        return ChampionDto(champion)
+    @get_many.register(ChampionDto)
+    @validate_query(
+        _validate_get_many_champion_query,
+        convert_region_to_platform,
+        _freeze_included_data,
+    )
+    def get_many_champion(
+        self, query: MutableMapping[str, Any], context: PipelineContext = None
+    ) -> Generator[ChampionDto, None, None]:
+        return self._get_many_entities(
+            ChampionDto, ChampionListDto, query, context, "champion"
+        )
 
     _validate_get_champion_list_query = (
         Query.has("platform")
@@ -136,7 +343,11 @@ class DDragon(DataSource):
     )
 
     @get.register(ChampionListDto)
-    @validate_query(_validate_get_champion_list_query, convert_region_to_platform)
+    @validate_query(
+        _validate_get_champion_list_query,
+        convert_region_to_platform,
+        _freeze_included_data,
+    )
     def get_champion_list(
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> ChampionListDto:
@@ -145,92 +356,95 @@ class DDragon(DataSource):
         )
         query["locale"] = locale
 
-        ahash = self.calculate_hash(query)
-        try:
-            return self._cache[ChampionListDto][ahash]
-        except KeyError:
-            pass
-
-        url = "https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/championFull.json".format(
-            version=query["version"], locale=locale
-        )
-        try:
-            body = self._client.get(url)[0]
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
+        ahash = self._list_hash(ChampionListDto, query)
+        with self._loading(ChampionListDto, ahash) as result:
+            if result is not None:
+                return result
 
-        for champ_name, champ in body["data"].items():
-            champ = ChampionDto(champ)
-            body["data"][champ_name] = champ
-            champ["region"] = query["platform"].region.value
-            body["locale"] = locale
-            body["includedData"] = {"all"}
-
-            champ["id"], champ["key"] = int(champ["key"]), champ["id"]
-
-            for skin in champ["skins"]:
-                # id str in DDragon, int in static data.
-                skin["id"] = int(skin["id"])
-                # Doesn't exist in static data.
-                skin.pop("chromas", None)
-
-            champ["passive"]["sanitizedDescription"] = champ["passive"]["description"]
-
-            for recommended in champ["recommended"]:
-                # These fields always(?) are the same and don't appear in static data.
-                [
-                    recommended.pop(key, None)
-                    for key in (
-                        "sortrank",
-                        "extensionPage",
-                        "customPanel",
-                        "customTag",
-                        "requiredPerk",
-                        "customPanelCurrencyType",
-                        "customPanelBuffCurrencyName",
-                    )
+            url = (
+                f"{_DDRAGON_URL}/cdn/{query['version']}/data/{locale}/championFull.json"
+            )
+            try:
+                body = self._client.get(url)[0]
+            except HTTPError as e:
+                raise NotFoundError(str(e)) from e
+
+            region = query["platform"].region.value
+            for champ_name, champ in body["data"].items():
+                champ = ChampionDto(champ)
+                body["data"][champ_name] = champ
+                champ["region"] = region
+
+                champ["id"], champ["key"] = int(champ["key"]), champ["id"]
+
+                for skin in champ["skins"]:
+                    # id str in DDragon, int in static data.
+                    skin["id"] = int(skin["id"])
+                    # Doesn't exist in static data.
+                    skin.pop("chromas", None)
+
+                champ["passive"]["sanitizedDescription"] = champ["passive"][
+                    "description"
                 ]
 
-                for block in recommended["blocks"]:
-                    # These don't appear in static data for whatever reason.
+                for recommended in champ["recommended"]:
+                    # These fields always(?) are the same and don't appear in static data.
                     [
-                        block.pop(key, None)
+                        recommended.pop(key, None)
                         for key in (
-                            "recSteps",
-                            "minSummonerLevel",
-                            "maxSummonerLevel",
-                            "showIfSummonerSpell",
-                            "hideIfSummonerSpell",
+                            "sortrank",
+                            "extensionPage",
+                            "customPanel",
+                            "customTag",
+                            "requiredPerk",
+                            "customPanelCurrencyType",
+                            "customPanelBuffCurrencyName",
                         )
                     ]
 
-                    for item in block["items"]:
-                        # id str in DDragon, int in static data.
-                        item["id"] = int(item["id"])
-                        # Doesn't exist.
-                        item.pop("hideCount", None)
-
-            for spell in champ["spells"]:
-                # id -> key
-                spell["key"] = spell.pop("id")
-                # effectBurn is null in DDragon, empty string in static data.
-                spell["effectBurn"][0] = ""
-                # TODO: Sanitizer?
-                spell["sanitizedDescription"] = spell["description"]
-                spell["sanitizedTooltip"] = spell["tooltip"]
-                # non-existent in static data(? used for charge based spells, not sure why static data strips it)
-                spell.pop("maxammo", None)
-
-                for var in spell["vars"]:
-                    # coeff is always a list, even if just one item
-                    if not isinstance(var["coeff"], list):
-                        var["coeff"] = [var["coeff"]]
-
-        body["region"] = query["platform"].region.value
-        body["locale"] = locale
-        body["includedData"] = {"all"}
-        result = ChampionListDto(body)
-        self._cache[ChampionListDto][ahash] = result
+                    for block in recommended["blocks"]:
+                        # These don't appear in static data for whatever reason.
+                        [
+                            block.pop(key, None)
+                            for key in (
+                                "recSteps",
+                                "minSummonerLevel",
+                                "maxSummonerLevel",
+                                "showIfSummonerSpell",
+                                "hideIfSummonerSpell",
+                            )
+                        ]
+
+                        for item in block["items"]:
+                            # id str in DDragon, int in static data.
+                            item["id"] = int(item["id"])
+                            # Doesn't exist.
+                            item.pop("hideCount", None)
+
+                for spell in champ["spells"]:
+                    # id -> key
+                    spell["key"] = spell.pop("id")
+                    # effectBurn is null in DDragon, empty string in static data.
+                    spell["effectBurn"][0] = ""
+                    # TODO: Sanitizer?
+                    spell["sanitizedDescription"] = spell["description"]
+                    spell["sanitizedTooltip"] = spell["tooltip"]
+                    # non-existent in static data(? used for charge based spells, not sure why static data strips it)
+                    spell.pop("maxammo", None)
+
+                    for var in spell["vars"]:
+                        # coeff is always a list, even if just one item
+                        if not isinstance(var["coeff"], list):
+                            var["coeff"] = [var["coeff"]]
+
+            body["region"] = region
+            body["locale"] = locale
+            body["includedData"] = _ALL_INCLUDED_DATA
+            result = ChampionListDto(body)
+            self._cache[ChampionListDto, ahash] = result
+            self._index_cache[ChampionListDto, ahash] = _index_by(
+                body["data"].values(), "id", "name"
+            )
         return result
 
     ############
@@ -244,7 +458,7 @@ class DDragon(DataSource):
     def get_versions(
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> VersionListDto:
-        url = "https://ddragon.leagueoflegends.com/api/versions.json"
+        url = f"{_DDRAGON_URL}/api/versions.json"
         try:
             body = self._client.get(url)[0]
         except HTTPError as e:
@@ -266,9 +480,7 @@ class DDragon(DataSource):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> RealmDto:
         region = query["platform"].region
-        url = "https://ddragon.leagueoflegends.com/realms/{region}.json".format(
-            region=region.value.lower()
-        )
+        url = f"{_DDRAGON_URL}/realms/{region.lower_value}.json"
         try:
             body = self._client.get(url)[0]
 
@@ -289,7 +501,7 @@ class DDragon(DataSource):
     def get_languages(
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> LanguagesDto:
-        url = "https://ddragon.leagueoflegends.com/cdn/languages.json"
+        url = f"{_DDRAGON_URL}/cdn/languages.json"
         try:
             body = self._client.get(url)[0]
         except HTTPError as e:
@@ -319,33 +531,18 @@ class DDragon(DataSource):
     def get_map(
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> MapDto:
-        maps_query = copy.deepcopy(query)
-        if "id" in maps_query:
-            maps_query.pop("id")
-        if "name" in maps_query:
-            maps_query.pop("name")
-        maps = context[context.Keys.PIPELINE].get(MapListDto, query=maps_query)
-
-        def find_matching_attribute(list_of_dtos, attrname, attrvalue):
-            for dto in list_of_dtos:
-                if dto.get(attrname, None) == attrvalue:
-                    return dto
-
-        # The `data` is a list of map data instances
+        indexes = self._get_list_indexes(
+            MapListDto, query, context, ("id", "name"), ("mapId", "mapName")
+        )
         if "id" in query:
-            find = "mapId", str(query["id"])
+            map = indexes["mapId"].get(str(query["id"]))
         elif "name" in query:
-            find = "mapName", query["name"]
+            map = indexes["mapName"].get(query["name"])
         else:
             raise RuntimeError("Impossible!")
-        map = find_matching_attribute(maps["data"].values(), *find)
         if map is None:
             raise NotFoundError
-        map["region"] = query["platform"].region.value
-        map["version"] = query["version"]
-        if "locale" in query:
-            map["locale"] = query["locale"]
-        return MapDto(map)
+        return MapDto(map, **_dto_fields(query))
 
     _validate_get_map_list_query = (
         Query.has("platform")
@@ -366,29 +563,26 @@ class DDragon(DataSource):
         )
         query["locale"] = locale
 
-        ahash = self.calculate_hash(query)
-        try:
-            return self._cache[MapListDto][ahash]
-        except KeyError:
-            pass
+        ahash = self._list_hash(MapListDto, query)
+        with self._loading(MapListDto, ahash) as result:
+            if result is not None:
+                return _for_region(result, query["platform"].region.value)
 
-        url = "https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/map.json".format(
-            version=query["version"], locale=locale
-        )
-        try:
-            body = self._client.get(url)[0]
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
+            url = f"{_DDRAGON_URL}/cdn/{query['version']}/data/{locale}/map.json"
+            try:
+                body = self._client.get(url)[0]
+            except HTTPError as e:
+                raise NotFoundError(str(e)) from e
 
-        body["region"] = query["platform"].region.value
-        body["locale"] = locale
-        for key, map in body["data"].items():
-            map = MapDto(map)
-            body["data"][key] = map
-            map["mapName"] = map.pop("MapName")
-            map["mapId"] = map.pop("MapId")
-        result = MapListDto(body)
-        self._cache[MapListDto][ahash] = result
+            body["region"] = query["platform"].region.value
+            body["locale"] = locale
+            for key, map in body["data"].items():
+                map = MapDto(map)
+                body["data"][key] = map
+                map["mapName"] = map.pop("MapName")
+                map["mapId"] = map.pop("MapId")
+            result = MapListDto(body)
+            self._cache[MapListDto, ahash] = result
         return result
 
     ####################
@@ -413,9 +607,7 @@ class DDragon(DataSource):
             query["locale"] if "locale" in query else query["platform"].default_locale
         )
 
-        url = "https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/language.json".format(
-            version=query["version"], locale=locale
-        )
+        url = f"{_DDRAGON_URL}/cdn/{query['version']}/data/{locale}/language.json"
         try:
             body = self._client.get(url)[0]
         except HTTPError as e:
@@ -443,46 +635,35 @@ class DDragon(DataSource):
     )
 
     @get.register(RuneDto)
-    @validate_query(_validate_get_rune_query, convert_region_to_platform)
+    @validate_query(
+        _validate_get_rune_query, convert_region_to_platform, _freeze_included_data
+    )
     def get_rune(
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> RuneDto:
-        runes_query = copy.deepcopy(query)
-        if "id" in runes_query:
-            runes_query.pop("id")
-        if "name" in runes_query:
-            runes_query.pop("name")
-        runes = context[context.Keys.PIPELINE].get(RuneListDto, query=runes_query)
-
-        def find_matching_attribute(list_of_dtos, attrname, attrvalue):
-            for dto in list_of_dtos:
-                if dto.get(attrname, None) == attrvalue:
-                    return dto
-
-        # The `data` is a list of rune data instances
-        if "id" in query:
-            find = "id", query["id"]
-        elif "name" in query:
-            find = "name", query["name"]
-        else:
-            raise RuntimeError("Impossible!")
-        if isinstance(runes["data"], list):
-            rune = find_matching_attribute(runes["data"], *find)
-        elif isinstance(runes["data"], dict):
-            rune = find_matching_attribute(runes["data"].values(), *find)
-        else:
-            raise ValueError(
-                "The runes data from DDragon came back in an unexpected format. Please report this on Github!"
-            )
-        if rune is None:
-            raise NotFoundError
-        rune["region"] = query["platform"].region.value
-        rune["version"] = query["version"]
-        if "locale" in query:
-            rune["locale"] = query["locale"]
-        if "includedData" in query:
-            rune["includedData"] = query["includedData"]
-        return RuneDto(rune)
+        return self._get_entity(RuneDto, RuneListDto, query, context)
+
+    _validate_get_many_rune_query = (
+        Query.has("platform")
+        .as_(Platform)
+        .also.has("ids")
+        .as_(Iterable)
+        .or_("names")
+        .as_(Iterable)
+        .also.can_have("version")
+        .with_default(_get_latest_version, supplies_type=str)
+        .also.can_have("locale")
+        .also.can_have("includedData")
+    )
+
+    @get_many.register(RuneDto)
+    @validate_query(
+        _validate_get_many_rune_query, convert_region_to_platform, _freeze_included_data
+    )
+    def get_many_rune(
+        self, query: MutableMapping[str, Any], context: PipelineContext = None
+    ) -> Generator[RuneDto, None, None]:
+        return self._get_many_entities(RuneDto, RuneListDto, query, context, "rune")
 
     _validate_get_rune_list_query = (
         Query.has("platform")
@@ -495,7 +676,9 @@ class DDragon(DataSource):
     )
 
     @get.register(RuneListDto)
-    @validate_query(_validate_get_rune_list_query, convert_region_to_platform)
+    @validate_query(
+        _validate_get_rune_list_query, convert_region_to_platform, _freeze_included_data
+    )
     def get_rune_list(
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> RuneListDto:
@@ -504,72 +687,72 @@ class DDragon(DataSource):
         )
         query["locale"] = locale
 
-        ahash = self.calculate_hash(query)
-        try:
-            return self._cache[RuneListDto][ahash]
-        except KeyError:
-            pass
-
-        url = "https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/runesReforged.json".format(
-            version=query["version"], locale=locale
-        )
-        try:
-            body = self._client.get(url)[0]
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
-
-        cdragon_url = "https://raw.communitydragon.org/pbe/plugins/rcp-be-lol-game-data/global/default/v1/perks.json"
-        try:
-            cdragon_body = self._client.get(cdragon_url)[0]
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
-
-        cdragon_runes = []
-        for rune in cdragon_body:
-            if str(rune["id"]).startswith("50"):
-                rune = {
-                    "id": rune["id"],
-                    "name": rune["name"],
-                    "key": rune["name"].replace(" ", ""),
-                    "shortDesc": rune["shortDesc"].encode("utf-8").decode("utf-8"),
-                    "longDesc": rune["longDesc"].encode("utf-8").decode("utf-8"),
-                    "icon": rune["iconPath"],
-                }
-                cdragon_runes.append(rune)
-        statperks = {
-            "id": 5000,
-            "key": "stats",
-            "name": "stats",
-            "icon": "",
-            "slots": [{"runes": cdragon_runes}],
-        }
-        body.append(statperks)
-        for path in body:
-            for tier, subpath in enumerate(path["slots"]):
-                for i, rune in enumerate(subpath["runes"]):
-                    rune["path"] = {
-                        "key": path["key"],
-                        "name": path["name"],
-                        "id": path["id"],
-                        "icon": path["icon"],
+        ahash = self._list_hash(RuneListDto, query)
+        with self._loading(RuneListDto, ahash) as result:
+            if result is not None:
+                return _for_region(result, query["platform"].region.value)
+
+            url = f"{_DDRAGON_URL}/cdn/{query['version']}/data/{locale}/runesReforged.json"
+            cdragon_url = "https://raw.communitydragon.org/pbe/plugins/rcp-be-lol-game-data/global/default/v1/perks.json"
+            # The two requests are independent, so wait on them together
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                response = executor.submit(self._client.get, url)
+                cdragon_response = executor.submit(self._client.get, cdragon_url)
+                try:
+                    body = response.result()[0]
+                    cdragon_body = cdragon_response.result()[0]
+                except HTTPError as e:
+                    raise NotFoundError(str(e)) from e
+
+            cdragon_runes = []
+            for rune in cdragon_body:
+                if str(rune["id"]).startswith("50"):
+                    rune = {
+                        "id": rune["id"],
+                        "name": rune["name"],
+                        "key": rune["name"].replace(" ", ""),
+                        "shortDesc": rune["shortDesc"].encode("utf-8").decode("utf-8"),
+                        "longDesc": rune["longDesc"].encode("utf-8").decode("utf-8"),
+                        "icon": rune["iconPath"],
                     }
-                    rune["tier"] = tier
-                    subpath[i] = RuneDto(rune)
-
-        body = {
-            "data": [
-                rune
-                for path in body
-                for subpath in path["slots"]
-                for rune in subpath["runes"]
-            ]
-        }
-        body["region"] = query["platform"].region.value
-        body["locale"] = locale
-        body["version"] = query["version"]
-        body["includedData"] = {"all"}
-        result = RuneListDto(body)
-        self._cache[RuneListDto][ahash] = result
+                    cdragon_runes.append(rune)
+            statperks = {
+                "id": 5000,
+                "key": "stats",
+                "name": "stats",
+                "icon": "",
+                "slots": [{"runes": cdragon_runes}],
+            }
+            body.append(statperks)
+            for path in body:
+                for tier, subpath in enumerate(path["slots"]):
+                    for i, rune in enumerate(subpath["runes"]):
+                        rune["path"] = {
+                            "key": path["key"],
+                            "name": path["name"],
+                            "id": path["id"],
+                            "icon": path["icon"],
+                        }
+                        rune["tier"] = tier
+                        subpath[i] = RuneDto(rune)
+
+            body = {
+                "data": [
+                    rune
+                    for path in body
+                    for subpath in path["slots"]
+                    for rune in subpath["runes"]
+                ],
+                "region": query["platform"].region.value,
+                "locale": locale,
+                "version": query["version"],
+                "includedData": _ALL_INCLUDED_DATA,
+            }
+            result = RuneListDto(body)
+            self._cache[RuneListDto, ahash] = result
+            self._index_cache[RuneListDto, ahash] = _index_by(
+                body["data"], "id", "name"
+            )
         return result
 
     _validate_get_rune_paths_query = (
@@ -583,12 +766,16 @@ class DDragon(DataSource):
     )
 
     @get.register(RunePathsDto)
-    @validate_query(_validate_get_rune_paths_query, convert_region_to_platform)
+    @validate_query(
+        _validate_get_rune_paths_query,
+        convert_region_to_platform,
+        _freeze_included_data,
+    )
     def get_rune_list(
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> RunePathsDto:
         pipeline = context[PipelineContext.Keys.PIPELINE]
-        runes = pipeline.get(RuneListDto, copy.deepcopy(query))["data"]
+        runes = pipeline.get(RuneListDto, dict(query))["data"]
         paths = defaultdict(dict)
         for rune in runes:
             if rune["path"]["id"] not in paths:
@@ -621,39 +808,35 @@ class DDragon(DataSource):
     )
 
     @get.register(ItemDto)
-    @validate_query(_validate_get_item_query, convert_region_to_platform)
+    @validate_query(
+        _validate_get_item_query, convert_region_to_platform, _freeze_included_data
+    )
     def get_item(
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> ItemDto:
-        items_query = copy.deepcopy(query)
-        if "id" in items_query:
-            items_query.pop("id")
-        if "name" in items_query:
-            items_query.pop("name")
-        items = context[context.Keys.PIPELINE].get(ItemListDto, query=items_query)
-
-        def find_matching_attribute(list_of_dtos, attrname, attrvalue):
-            for dto in list_of_dtos:
-                if dto.get(attrname, None) == attrvalue:
-                    return dto
-
-        # The `data` is a list of item data instances
-        if "id" in query:
-            find = "id", query["id"]
-        elif "name" in query:
-            find = "name", query["name"]
-        else:
-            raise RuntimeError("Impossible!")
-        item = find_matching_attribute(items["data"].values(), *find)
-        if item is None:
-            raise NotFoundError
-        item["region"] = query["platform"].region.value
-        item["version"] = query["version"]
-        if "locale" in query:
-            item["locale"] = query["locale"]
-        if "includedData" in query:
-            item["includedData"] = query["includedData"]
-        return ItemDto(item)
+        return self._get_entity(ItemDto, ItemListDto, query, context)
+
+    _validate_get_many_item_query = (
+        Query.has("platform")
+        .as_(Platform)
+        .also.has("ids")
+        .as_(Iterable)
+        .or_("names")
+        .as_(Iterable)
+        .also.can_have("version")
+        .with_default(_get_latest_version, supplies_type=str)
+        .also.can_have("locale")
+        .also.can_have("includedData")
+    )
+
+    @get_many.register(ItemDto)
+    @validate_query(
+        _validate_get_many_item_query, convert_region_to_platform, _freeze_included_data
+    )
+    def get_many_item(
+        self, query: MutableMapping[str, Any], context: PipelineContext = None
+    ) -> Generator[ItemDto, None, None]:
+        return self._get_many_entities(ItemDto, ItemListDto, query, context, "item")
 
     _validate_get_item_list_query = (
         Query.has("platform")
@@ -666,7 +849,9 @@ class DDragon(DataSource):
     )
 
     @get.register(ItemListDto)
-    @validate_query(_validate_get_item_list_query, convert_region_to_platform)
+    @validate_query(
+        _validate_get_item_list_query, convert_region_to_platform, _freeze_included_data
+    )
     def get_item_list(
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> ItemListDto:
@@ -675,48 +860,44 @@ class DDragon(DataSource):
         )
         query["locale"] = locale
 
-        ahash = self.calculate_hash(query)
-        try:
-            return self._cache[ItemListDto][ahash]
-        except KeyError:
-            pass
+        ahash = self._list_hash(ItemListDto, query)
+        with self._loading(ItemListDto, ahash) as result:
+            if result is not None:
+                return _for_region(result, query["platform"].region.value)
 
-        url = "https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/item.json".format(
-            version=query["version"], locale=locale
-        )
-        try:
-            body = self._client.get(url)[0]
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
+            url = f"{_DDRAGON_URL}/cdn/{query['version']}/data/{locale}/item.json"
+            try:
+                body = self._client.get(url)[0]
+            except HTTPError as e:
+                raise NotFoundError(str(e)) from e
 
-        body.pop("basic")
-
-        for group in body["groups"]:
-            # key in static data -> id on DDragon
-            group["key"] = group.pop("id")
-
-        for item_id, item in body["data"].items():
-            item = ItemDto(item)
-            body["data"][item_id] = item
-            item["id"] = int(item_id)
-            # TODO: Sanitizer?
-            item["sanitizedDescription"] = item["description"]
-            if item["id"] == 3632:  # This item doesn't have a name.
-                item["name"] = ""
-            if "tags" not in item:
-                item["tags"] = []
-            if "depth" not in item:
-                item["depth"] = 1
-            if "colloq" not in item:
-                item["colloq"] = ""
-            if "plaintext" not in item:
-                item["plaintext"] = ""
+            body.pop("basic")
 
-        body["region"] = query["platform"].region.value
-        body["locale"] = locale
-        body["includedData"] = {"all"}
-        result = ItemListDto(body)
-        self._cache[ItemListDto][ahash] = result
+            for group in body["groups"]:
+                # key in static data -> id on DDragon
+                group["key"] = group.pop("id")
+
+            for item_id, item in body["data"].items():
+                item = ItemDto(item)
+                body["data"][item_id] = item
+                item["id"] = int(item_id)
+                # TODO: Sanitizer?
+                item["sanitizedDescription"] = item["description"]
+                if item["id"] == 3632:  # This item doesn't have a name.
+                    item["name"] = ""
+                item.setdefault("tags", [])
+                item.setdefault("depth", 1)
+                item.setdefault("colloq", "")
+                item.setdefault("plaintext", "")
+
+            body["region"] = query["platform"].region.value
+            body["locale"] = locale
+            body["includedData"] = _ALL_INCLUDED_DATA
+            result = ItemListDto(body)
+            self._cache[ItemListDto, ahash] = result
+            self._index_cache[ItemListDto, ahash] = _index_by(
+                body["data"].values(), "id", "name"
+            )
         return result
 
     ###################
@@ -737,43 +918,41 @@ class DDragon(DataSource):
     )
 
     @get.register(SummonerSpellDto)
-    @validate_query(_validate_get_summoner_spell_query, convert_region_to_platform)
+    @validate_query(
+        _validate_get_summoner_spell_query,
+        convert_region_to_platform,
+        _freeze_included_data,
+    )
     def get_summoner_spell(
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> SummonerSpellDto:
-        summoner_spells_query = copy.deepcopy(query)
-        if "id" in summoner_spells_query:
-            summoner_spells_query.pop("id")
-        if "name" in summoner_spells_query:
-            summoner_spells_query.pop("name")
-        summoner_spells = context[context.Keys.PIPELINE].get(
-            SummonerSpellListDto, query=summoner_spells_query
-        )
+        return self._get_entity(SummonerSpellDto, SummonerSpellListDto, query, context)
 
-        def find_matching_attribute(list_of_dtos, attrname, attrvalue):
-            for dto in list_of_dtos:
-                if dto.get(attrname, None) == attrvalue:
-                    return dto
+    _validate_get_many_summoner_spell_query = (
+        Query.has("platform")
+        .as_(Platform)
+        .also.has("ids")
+        .as_(Iterable)
+        .or_("names")
+        .as_(Iterable)
+        .also.can_have("version")
+        .with_default(_get_latest_version, supplies_type=str)
+        .also.can_have("locale")
+        .also.can_have("includedData")
+    )
 
-        # The `data` is a list of summoner_spell data instances
-        if "id" in query:
-            find = "id", query["id"]
-        elif "name" in query:
-            find = "name", query["name"]
-        else:
-            raise RuntimeError("Impossible!")
-        summoner_spell = find_matching_attribute(
-            summoner_spells["data"].values(), *find
+    @get_many.register(SummonerSpellDto)
+    @validate_query(
+        _validate_get_many_summoner_spell_query,
+        convert_region_to_platform,
+        _freeze_included_data,
+    )
+    def get_many_summoner_spell(
+        self, query: MutableMapping[str, Any], context: PipelineContext = None
+    ) -> Generator[SummonerSpellDto, None, None]:
+        return self._get_many_entities(
+            SummonerSpellDto, SummonerSpellListDto, query, context, "summoner spell"
         )
-        if summoner_spell is None:
-            raise NotFoundError
-        summoner_spell["region"] = query["platform"].region.value
-        summoner_spell["version"] = query["version"]
-        if "locale" in query:
-            summoner_spell["locale"] = query["locale"]
-        if "includedData" in query:
-            summoner_spell["includedData"] = query["includedData"]
-        return SummonerSpellDto(summoner_spell)
 
     _validate_get_summoner_spell_list_query = (
         Query.has("platform")
@@ -786,7 +965,11 @@ class DDragon(DataSource):
     )
 
     @get.register(SummonerSpellListDto)
-    @validate_query(_validate_get_summoner_spell_list_query, convert_region_to_platform)
+    @validate_query(
+        _validate_get_summoner_spell_list_query,
+        convert_region_to_platform,
+        _freeze_included_data,
+    )
     def get_summoner_spell_list(
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> SummonerSpellListDto:
@@ -795,38 +978,35 @@ class DDragon(DataSource):
         )
         query["locale"] = locale
 
-        ahash = self.calculate_hash(query)
-        try:
-            return self._cache[SummonerSpellListDto][ahash]
-        except KeyError:
-            pass
-
-        url = "https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/summoner.json".format(
-            version=query["version"], locale=locale
-        )
-        try:
-            body = self._client.get(url)[0]
-        except HTTPError as e:
-            raise NotFoundError(str(e)) from e
-
-        for ss_name, ss in body["data"].items():
-            ss = SummonerSpellDto(ss)
-            body["data"][ss_name] = ss
-            # key and id are switched between DDragon and static data. Also, id is of type int, instead of str.
-            ss["id"], ss["key"] = int(ss["key"]), ss["id"]
-            # effectBurn"s first element is an null in DDragon, but an empty string in static data..
-            ss["effectBurn"][0] = ""
-            # Usually -1, doesn"t exist in static data.
-            ss.pop("maxammo")
-            # TODO: Sanitizer?
-            ss["sanitizedDescription"] = ss["description"]
-            ss["sanitizedTooltip"] = ss["tooltip"]
+        ahash = self._list_hash(SummonerSpellListDto, query)
+        with self._loading(SummonerSpellListDto, ahash) as result:
+            if result is not None:
+                return _for_region(result, query["platform"].region.value)
+
+            url = f"{_DDRAGON_URL}/cdn/{query['version']}/data/{locale}/summoner.json"
+            try:
+                body = self._client.get(url)[0]
+            except HTTPError as e:
+                raise NotFoundError(str(e)) from e
+
+            for ss_name, ss in body["data"].items():
+                ss = SummonerSpellDto(ss)
+                body["data"][ss_name] = ss
+                # key and id are switched between DDragon and static data. Also, id is of type int, instead of str.
+                ss["id"], ss["key"] = int(ss["key"]), ss["id"]
+                # effectBurn"s first element is an null in DDragon, but an empty string in static data..
+                ss["effectBurn"][0] = ""
+                # Usually -1, doesn"t exist in static data.
+                ss.pop("maxammo")
+                # TODO: Sanitizer?
+                ss["sanitizedDescription"] = ss["description"]
+                ss["sanitizedTooltip"] = ss["tooltip"]
 
-        body["region"] = query["platform"].region.value
-        body["locale"] = locale
-        body["includedData"] = {"all"}
-        result = SummonerSpellListDto(body)
-        self._cache[SummonerSpellListDto][ahash] = result
+            body["region"] = query["platform"].region.value
+            body["locale"] = locale
+            body["includedData"] = _ALL_INCLUDED_DATA
+            result = SummonerSpellListDto(body)
+            self._cache[SummonerSpellListDto, ahash] = result
         return result
 
     #################
@@ -851,19 +1031,19 @@ class DDragon(DataSource):
             query["locale"] if "locale" in query else query["platform"].default_locale
         )
 
-        url = "https://ddragon.leagueoflegends.com/cdn/{version}/data/{locale}/profileicon.json".format(
-            version=query["version"], locale=locale
-        )
+        url = f"{_DDRAGON_URL}/cdn/{query['version']}/data/{locale}/profileicon.json"
         try:
             body = self._client.get(url)[0]
         except HTTPError as e:
             raise NotFoundError(str(e)) from e
 
-        body["region"] = query["platform"].region.value
+        region = query["platform"].region.value
+        version = query["version"]
+        body["region"] = region
         body["locale"] = locale
-        body["version"] = query["version"]
+        body["version"] = version
         for pi in body["data"].values():
-            pi["region"] = body["region"]
-            pi["version"] = body["version"]
+            pi["region"] = region
+            pi["version"] = version
             pi["locale"] = locale
         return ProfileIconDataDto(body)
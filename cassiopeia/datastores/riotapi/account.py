@@ -60,14 +60,14 @@ class AccountAPI(RiotAPIService):
         if "puuid" in query:
             puuid = query["puuid"]
             url = "https://{continent}.api.riotgames.com/riot/account/v1/accounts/by-puuid/{puuid}".format(
-                continent=continent.value.lower(), puuid=puuid
+                continent=continent.lower_value, puuid=puuid
             )
             endpoint = "accounts/puuid"
         elif "name" in query and "tagline" in query:
             game_name = query["name"].replace(" ", "%20")
             tagline = query["tagline"].replace(" ", "%20")
             url = "https://{continent}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/{game_name}/{tagline}".format(
-                continent=continent.value.lower(),
+                continent=continent.lower_value,
                 game_name=game_name,
                 tagline=tagline,
             )
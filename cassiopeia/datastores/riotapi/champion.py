@@ -43,7 +43,7 @@ class ChampionAPI(RiotAPIService):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> ChampionRotationDto:
         url = "https://{platform}.api.riotgames.com/lol/platform/v3/champion-rotations".format(
-            platform=query["platform"].value.lower()
+            platform=query["platform"].lower_value
         )
         try:
             app_limiter, method_limiter = self._get_rate_limiter(
@@ -55,7 +55,7 @@ class ChampionMasteryAPI(RiotAPIService):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> ChampionMasteryDto:
         url = "https://{platform}.api.riotgames.com/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}/by-champion/{championId}".format(
-            platform=query["platform"].value.lower(),
+            platform=query["platform"].lower_value,
             puuid=query["puuid"],
             championId=query["champion.id"],
         )
@@ -95,7 +95,7 @@ class ChampionMasteryAPI(RiotAPIService):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> Generator[ChampionMasteryDto, None, None]:
         url = "https://{platform}.api.riotgames.com/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}".format(
-            platform=query["platform"].value.lower(), puuid=query["puuid"]
+            platform=query["platform"].lower_value, puuid=query["puuid"]
         )
         try:
             endpoint = "champion-masteries/by-puuid/puuid"
@@ -139,7 +139,7 @@ class ChampionMasteryAPI(RiotAPIService):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> ChampionMasteryListDto:
         url = "https://{platform}.api.riotgames.com/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}".format(
-            platform=query["platform"].value.lower(), puuid=query["puuid"]
+            platform=query["platform"].lower_value, puuid=query["puuid"]
         )
         try:
             endpoint = "champion-masteries/by-puuid/puuid"
@@ -176,7 +176,7 @@ class ChampionMasteryAPI(RiotAPIService):
         def generator():
             for summoner_id in query["summoner.ids"]:
                 url = "https://{platform}.api.riotgames.com/lol/champion-mastery/v4/champion-masteries/by-summoner/{summonerId}".format(
-                    platform=query["platform"].value.lower(), summonerId=summoner_id
+                    platform=query["platform"].lower_value, summonerId=summoner_id
                 )
                 try:
                     endpoint = "champion-masteries/by-summoner/summonerId"
@@ -211,7 +211,7 @@ class ChampionMasteryAPI(RiotAPIService):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> ChampionMasteryScoreDto:
         url = "https://{platform}.api.riotgames.com/lol/champion-mastery/v4/scores/by-puuid/{puuid}".format(
-            platform=query["platform"].value.lower(), puuid=query["puuid"]
+            platform=query["platform"].lower_value, puuid=query["puuid"]
         )
         try:
             endpoint = "scores/by-puuid/puuid"
@@ -246,7 +246,7 @@ class ChampionMasteryAPI(RiotAPIService):
         def generator():
             for summoner_id in query["summoner.ids"]:
                 url = "https://{platform}.api.riotgames.com/lol/champion-mastery/v4/scores/by-summoner/{summonerId}".format(
-                    platform=query["platform"].value.lower(), summonerId=summoner_id
+                    platform=query["platform"].lower_value, summonerId=summoner_id
                 )
                 try:
                     endpoint = "scores/by-summoner/summonerId"
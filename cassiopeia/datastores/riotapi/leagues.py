@@ -62,7 +62,7 @@ class LeaguesAPI(RiotAPIService):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> LeagueEntriesDto:
         url = "https://{platform}.api.riotgames.com/lol/league/v4/entries/{queue}/{tier}/{division}".format(
-            platform=query["platform"].value.lower(),
+            platform=query["platform"].lower_value,
             queue=query["queue"].value,
             tier=query["tier"].value,
             division=query["division"].value,
@@ -103,7 +103,7 @@ class LeaguesAPI(RiotAPIService):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> LeagueSummonerEntriesDto:
         url = "https://{platform}.api.riotgames.com/lol/league/v4/entries/by-summoner/{id}".format(
-            platform=query["platform"].value.lower(), id=query["summoner.id"]
+            platform=query["platform"].lower_value, id=query["summoner.id"]
         )
         try:
             app_limiter, method_limiter = self._get_rate_limiter(
@@ -133,7 +133,7 @@ class LeaguesAPI(RiotAPIService):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> LeagueDto:
         url = "https://{platform}.api.riotgames.com/lol/league/v4/leagues/{leagueId}".format(
-            platform=query["platform"].value.lower(), leagueId=query["id"]
+            platform=query["platform"].lower_value, leagueId=query["id"]
         )
         try:
             endpoint = "leagues/leagueId {}".format(query["platform"].value)
@@ -164,7 +164,7 @@ class LeaguesAPI(RiotAPIService):
         def generator():
             for id in query["ids"]:
                 url = "https://{platform}.api.riotgames.com/lol/league/v4/leagues/{leagueId}".format(
-                    platform=query["platform"].value.lower(), leagueId=id
+                    platform=query["platform"].lower_value, leagueId=id
                 )
                 try:
                     endpoint = "leagues/leagueId {}".format(query["platform"].value)
@@ -197,7 +197,7 @@ class LeaguesAPI(RiotAPIService):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> ChallengerLeagueListDto:
         url = "https://{platform}.api.riotgames.com/lol/league/v4/challengerleagues/by-queue/{queueName}".format(
-            platform=query["platform"].value.lower(), queueName=query["queue"].value
+            platform=query["platform"].lower_value, queueName=query["queue"].value
         )
         try:
             endpoint = "challengerleagues/by-queue {}".format(query["platform"].value)
@@ -230,7 +230,7 @@ class LeaguesAPI(RiotAPIService):
         def generator():
             for queue in query["queues"]:
                 url = "https://{platform}.api.riotgames.com/lol/league/v4/challengerleagues/by-queue/{queueName}".format(
-                    platform=query["platform"].value.lower(), queueName=queue.value
+                    platform=query["platform"].lower_value, queueName=queue.value
                 )
                 try:
                     endpoint = "challengerleagues/by-queue {}".format(
@@ -264,7 +264,7 @@ class LeaguesAPI(RiotAPIService):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> GrandmasterLeagueListDto:
         url = "https://{platform}.api.riotgames.com/lol/league/v4/grandmasterleagues/by-queue/{queueName}".format(
-            platform=query["platform"].value.lower(), queueName=query["queue"].value
+            platform=query["platform"].lower_value, queueName=query["queue"].value
         )
         try:
             endpoint = "grandmasterleagues/by-queue {}".format(query["platform"].value)
@@ -297,7 +297,7 @@ class LeaguesAPI(RiotAPIService):
         def generator():
             for queue in query["queues"]:
                 url = "https://{platform}.api.riotgames.com/lol/league/v4/grandmasterleagues/by-queue/{queueName}".format(
-                    platform=query["platform"].value.lower(), queueName=queue.value
+                    platform=query["platform"].lower_value, queueName=queue.value
                 )
                 try:
                     endpoint = "grandmasterleagues/by-queue {}".format(
@@ -331,7 +331,7 @@ class LeaguesAPI(RiotAPIService):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> MasterLeagueListDto:
         url = "https://{platform}.api.riotgames.com/lol/league/v4/masterleagues/by-queue/{queueName}".format(
-            platform=query["platform"].value.lower(), queueName=query["queue"].value
+            platform=query["platform"].lower_value, queueName=query["queue"].value
         )
         try:
             endpoint = "masterleagues/by-queue {}".format(query["platform"].value)
@@ -362,7 +362,7 @@ class LeaguesAPI(RiotAPIService):
         def generator():
             for queue in query["queues"]:
                 url = "https://{platform}.api.riotgames.com/lol/league/v4/masterleagues/by-queue/{queueName}".format(
-                    platform=query["platform"].value.lower(), queueName=queue.value
+                    platform=query["platform"].lower_value, queueName=queue.value
                 )
                 try:
                     endpoint = "masterleagues/by-queue {}".format(
@@ -55,7 +55,7 @@ class MatchAPI(RiotAPIService):
         platform: Platform = query["platform"]
         continent = platform.continent
         id = query["id"]
-        url = f"https://{continent.value.lower()}.api.riotgames.com/lol/match/v5/matches/{platform.value}_{id}"
+        url = f"https://{continent.lower_value}.api.riotgames.com/lol/match/v5/matches/{platform.value}_{id}"
         try:
             app_limiter, method_limiter = self._get_rate_limiter(
                 continent, "matches/id"
@@ -101,7 +101,7 @@ class MatchAPI(RiotAPIService):
 
         def generator():
             for id in query["ids"]:
-                url = f"https://{continent.value.lower()}.api.riotgames.com/lol/match/v5/matches/{platform.value}_{id}"
+                url = f"https://{continent.lower_value}.api.riotgames.com/lol/match/v5/matches/{platform.value}_{id}"
                 try:
                     app_limiter, method_limiter = self._get_rate_limiter(
                         continent, "matches/id"
@@ -189,7 +189,7 @@ class MatchAPI(RiotAPIService):
 
         continent: Continent = query["continent"]
         puuid: str = query["puuid"]
-        url = f"https://{continent.value.lower()}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
+        url = f"https://{continent.lower_value}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
         try:
             app_limiter, method_limiter = self._get_rate_limiter(
                 continent, "matchlists/by-puuid/puuid"
@@ -236,7 +236,7 @@ class MatchAPI(RiotAPIService):
         continent: Continent = platform.continent
         id = query["id"]
 
-        url = f"https://{continent.value.lower()}.api.riotgames.com/lol/match/v5/matches/{platform.value}_{id}/timeline"
+        url = f"https://{continent.lower_value}.api.riotgames.com/lol/match/v5/matches/{platform.value}_{id}/timeline"
         try:
             app_limiter, method_limiter = self._get_rate_limiter(
                 continent, "matches/id/timeline"
@@ -63,7 +63,7 @@ class SpectatorAPI(RiotAPIService):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> CurrentGameInfoDto:
         url = "https://{platform}.api.riotgames.com/lol/spectator/v5/active-games/by-summoner/{puuid}".format(
-            platform=query["platform"].value.lower(), puuid=query["summoner.puuid"]
+            platform=query["platform"].lower_value, puuid=query["summoner.puuid"]
         )
         try:
             app_limiter, method_limiter = self._get_rate_limiter(
@@ -90,7 +90,7 @@ class SpectatorAPI(RiotAPIService):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> FeaturedGamesDto:
         url = "https://{platform}.api.riotgames.com/lol/spectator/v5/featured-games".format(
-            platform=query["platform"].value.lower()
+            platform=query["platform"].lower_value
         )
         try:
             app_limiter, method_limiter = self._get_rate_limiter(
@@ -61,7 +61,7 @@ class StatusAPI(RiotAPIService):
         self, query: MutableMapping[str, Any], context: PipelineContext = None
     ) -> ShardStatusDto:
         url = "https://{platform}.api.riotgames.com/lol/status/v4/platform-data".format(
-            platform=query["platform"].value.lower()
+            platform=query["platform"].lower_value
         )
         try:
             app_limiter, method_limiter = self._get_rate_limiter(
@@ -87,7 +87,7 @@ class StatusAPI(RiotAPIService):
             for platform in query["platforms"]:
                 platform = Platform(platform.upper())
                 url = "https://{platform}.api.riotgames.com/lol/status/v4/platform-data".format(
-                    platform=platform.value.lower()
+                    platform=platform.lower_value
                 )
                 try:
                     app_limiter, method_limiter = self._get_rate_limiter(
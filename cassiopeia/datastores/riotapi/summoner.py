@@ -53,18 +53,18 @@ class SummonerAPI(RiotAPIService):
     ) -> SummonerDto:
         if "id" in query:
             url = "https://{platform}.api.riotgames.com/lol/summoner/v4/summoners/{summonerId}".format(
-                platform=query["platform"].value.lower(), summonerId=query["id"]
+                platform=query["platform"].lower_value, summonerId=query["id"]
             )
             endpoint = "summoners/summonerId"
         elif "accountId" in query:
             url = "https://{platform}.api.riotgames.com/lol/summoner/v4/summoners/by-account/{accountId}".format(
-                platform=query["platform"].value.lower(), accountId=query["accountId"]
+                platform=query["platform"].lower_value, accountId=query["accountId"]
             )
             endpoint = "summoners/by-account/accountId"
         elif "puuid" in query:
             url = url = (
                 "https://{platform}.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/{puuid}".format(
-                    platform=query["platform"].value.lower(), puuid=query["puuid"]
+                    platform=query["platform"].lower_value, puuid=query["puuid"]
                 )
             )
             endpoint = "summoners/by-puuid/puuid"
@@ -100,7 +100,8 @@ def _rgetattr(obj, key):
 
 
 def _hash_included_data(included_data: Set[str]) -> int:
-    return hash(tuple(included_data))
+    # Independent of insertion order, and a frozenset caches its own hash
+    return hash(frozenset(included_data))
 
 
 def _get_default_version(query: Mapping[str, Any], context: PipelineContext) -> str:
@@ -2,4 +2,4 @@ from .common import DtoObject
 
 
 class AccountDto(DtoObject):
-    pass
+    __slots__ = ()
@@ -2,4 +2,4 @@ from .common import DtoObject
 
 
 class ChampionRotationDto(DtoObject):
-    pass
+    __slots__ = ()
@@ -2,12 +2,12 @@ from .common import DtoObject
 
 
 class ChampionMasteryDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class ChampionMasteryListDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class ChampionMasteryScoreDto(DtoObject):
-    pass
+    __slots__ = ()
@@ -10,6 +10,9 @@ except ImportError:
 
 
 class DtoObject(dict):
+    # Dtos only hold their items, so don't give every instance a __dict__ too
+    __slots__ = ()
+
     @property
     def __dict__(self):
         return {k: v for k, v in self.items()}
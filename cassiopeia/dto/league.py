@@ -2,32 +2,32 @@ from .common import DtoObject
 
 
 class MiniSeriesDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class LeagueEntryDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class LeagueDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class LeagueSummonerEntriesDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class LeagueEntriesDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class ChallengerLeagueListDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class GrandmasterLeagueListDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class MasterLeagueListDto(DtoObject):
-    pass
+    __slots__ = ()
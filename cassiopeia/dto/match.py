@@ -2,16 +2,16 @@ from .common import DtoObject
 
 
 class MatchReferenceDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class MatchListDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class MatchDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class TimelineDto(DtoObject):
-    pass
+    __slots__ = ()
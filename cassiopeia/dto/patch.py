@@ -2,4 +2,4 @@ from .common import DtoObject
 
 
 class PatchListDto(DtoObject):
-    pass
+    __slots__ = ()
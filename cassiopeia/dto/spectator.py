@@ -2,8 +2,8 @@ from .common import DtoObject
 
 
 class CurrentGameInfoDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class FeaturedGamesDto(DtoObject):
-    pass
+    __slots__ = ()
@@ -2,24 +2,24 @@ from ..common import DtoObject
 
 
 class ChampionDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class ChampionListDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class ChampionReleasesDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class ChampionReleaseDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class ChampionAllRatesDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class ChampionRatesDto(DtoObject):
-    pass
+    __slots__ = ()
@@ -2,8 +2,8 @@ from ..common import DtoObject
 
 
 class ItemDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class ItemListDto(DtoObject):
-    pass
+    __slots__ = ()
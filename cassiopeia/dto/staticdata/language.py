@@ -2,8 +2,8 @@ from ..common import DtoObject
 
 
 class LanguageStringsDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class LanguagesDto(DtoObject):
-    pass
+    __slots__ = ()
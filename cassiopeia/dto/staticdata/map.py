@@ -2,8 +2,8 @@ from ..common import DtoObject
 
 
 class MapDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class MapListDto(DtoObject):
-    pass
+    __slots__ = ()
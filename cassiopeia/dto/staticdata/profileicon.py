@@ -2,8 +2,8 @@ from ..common import DtoObject
 
 
 class ProfileIconDataDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class ProfileIconDetailsDto(DtoObject):
-    pass
+    __slots__ = ()
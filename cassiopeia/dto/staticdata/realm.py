@@ -2,4 +2,4 @@ from ..common import DtoObject
 
 
 class RealmDto(DtoObject):
-    pass
+    __slots__ = ()
@@ -2,16 +2,16 @@ from ..common import DtoObject
 
 
 class RuneDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class RuneListDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class RunePathsDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class RunePathDto(DtoObject):
-    pass
+    __slots__ = ()
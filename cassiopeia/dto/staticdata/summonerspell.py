@@ -2,8 +2,8 @@ from ..common import DtoObject
 
 
 class SummonerSpellDto(DtoObject):
-    pass
+    __slots__ = ()
 
 
 class SummonerSpellListDto(DtoObject):
-    pass
+    __slots__ = ()
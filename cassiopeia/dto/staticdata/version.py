@@ -2,4 +2,4 @@ from ..common import DtoObject
 
 
 class VersionListDto(DtoObject):
-    pass
+    __slots__ = ()
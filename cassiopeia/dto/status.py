@@ -2,4 +2,4 @@ from .common import DtoObject
 
 
 class ShardStatusDto(DtoObject):
-    pass
+    __slots__ = ()
@@ -2,4 +2,4 @@ from .common import DtoObject
 
 
 class SummonerDto(DtoObject):
-    pass
+    __slots__ = ()